@@ -2,8 +2,10 @@
 
 from enum import IntEnum
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 import struct
+import binascii
+import dataclasses
 from dataclasses import dataclass
 
 MMPSU_UART_BAUD = 115200
@@ -15,9 +17,16 @@ PAYLOAD_LEN_L_IND = 2
 PAYLOAD_LEN_H_IND = 3
 CRC_SIZE = 2
 
+# CRC-16/CCITT-FALSE (check value 0x29B1 over b"123456789"), sent MSB first
+# after the payload. binascii.crc_hqx hard-codes the 0x1021 polynomial, so only
+# the initial value can be changed here. Nothing in this repo confirms this is
+# the CRC the MMPSU firmware computes; until it is, MmpsuV2Uart doesn't enforce
+# received CRCs by default. test/test_crc.py holds the reference vectors.
+CRC16_INIT = 0xFFFF
+
 
 # ==============================================================================
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class FieldData:
     """Holds data about a MMSPU field/register"""
 
@@ -29,43 +38,65 @@ class FieldData:
     units: str = ""
     writable: bool = False
 
-    def pack_into(self, dst: bytearray, value: Any, offset: int) -> int:
-        """Pack value and this object's register number into the given
-        bytearray and offset depending on this field's type"""
-        fmt_str = ""
+    # derived from field_type in __post_init__
+    pack_fmt: str = dataclasses.field(init=False)
+    unpack_from: Callable[[bytes | bytearray | memoryview, int], Any] = dataclasses.field(
+        init=False
+    )
+    _pack_struct: struct.Struct | None = dataclasses.field(init=False)
+    _unpack_struct: struct.Struct | None = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        """Pick the packing structs for this field's type once, rather than on
+        every pack/unpack."""
         if self.field_type == int:
-            fmt_str = "<Bi"
+            val_fmt = "i"
         elif self.field_type == float:
-            fmt_str = "Bf"
+            val_fmt = "f"
         elif self.field_type == bool:
-            fmt_str = "B?xxx"
+            val_fmt = "?xxx"
         elif self.field_type == bytes or self.field_type == bytearray:
-            fmt_str = f"B{len(value)}s"
+            val_fmt = "4s"
         else:
-            # unrecognized type, do nothing
-            return 0
-        struct.pack_into(fmt_str, dst, offset, self.reg, value)
-        return struct.calcsize(fmt_str)
-
-    def unpack_from(self, src: bytearray, offset: int) -> Any:
-        """Unpack value from the given bytearray and offset, depending on this
-        field's type. Note we need to be pointing at the value, not the reg
-        number."""
-        fmt_str = ""
-        if self.field_type == int:
-            fmt_str = "<i"
-        elif self.field_type == float:
-            fmt_str = "f"
-        elif self.field_type == bool:
-            fmt_str = "?xxx"
-        elif self.field_type == bytes or self.field_type == bytearray:
-            fmt_str = "4s"
+            # unrecognized type, pack/unpack will do nothing
+            val_fmt = ""
+
+        if val_fmt:
+            self.pack_fmt = "B" + val_fmt
+            self._pack_struct = struct.Struct("<" + self.pack_fmt)
+            self._unpack_struct = struct.Struct("<" + val_fmt)
         else:
+            self.pack_fmt = ""
+            self._pack_struct = None
+            self._unpack_struct = None
+
+        # the type never changes, so bind an unpack function specialised to
+        # it instead of dispatching on it every call
+        self.unpack_from = self._make_unpacker()
+
+    def pack_into(self, dst: bytearray | memoryview, value: Any, offset: int) -> int:
+        """Pack value and this object's register number into the given
+        bytearray and offset depending on this field's type"""
+        if self._pack_struct is None:
             # unrecognized type, do nothing
             return 0
+        self._pack_struct.pack_into(dst, offset, self.reg, value)
+        return self._pack_struct.size
+
+    def _make_unpacker(self) -> Callable[[bytes | bytearray | memoryview, int], Any]:
+        """Build this field's unpack_from(src, offset) function, which unpacks
+        a value from the given bytearray and offset. Note we need to be
+        pointing at the value, not the reg number."""
+        if self._unpack_struct is None:
+            # unrecognized type, do nothing
+            return lambda src, offset: 0
+
+        unpack = self._unpack_struct.unpack_from
 
-        retval = struct.unpack_from(fmt_str, src, offset)
-        return retval[0]
+        def unpack_from(src: bytes | bytearray | memoryview, offset: int) -> Any:
+            return unpack(src, offset)[0]
+
+        return unpack_from
 
 
 # ==============================================================================
@@ -89,11 +120,12 @@ class MmpsuV2ErrorCodes(IntEnum):
     ERR_UNKNOWN_CMD = 2
 
 
-MMPSU_ERR_CODES = {
-    MmpsuV2ErrorCodes.ERR_NONE: "",
-    MmpsuV2ErrorCodes.ERR_CRC: "ERR_CRC",
-    MmpsuV2ErrorCodes.ERR_UNKNOWN_CMD: "ERR_UNKNOWN_CMD",
-}
+# indexed by MmpsuV2ErrorCodes value
+MMPSU_ERR_CODES = [
+    "",  # ERR_NONE
+    "ERR_CRC",
+    "ERR_UNKNOWN_CMD",
+]
 
 
 # ==============================================================================
@@ -556,7 +588,12 @@ class MmpsuV2Base(ABC):
 
     def __init__(self, regmap: List[FieldData]):
         self._regmap = {field_data.name: field_data for field_data in regmap}
-        self._regmap_by_num = {field_data.reg: field_data for field_data in regmap}
+        # reg numbers are dense, so index a list by reg number directly
+        self._regmap_by_num: List[FieldData | None] = [None] * (
+            max(field_data.reg for field_data in regmap) + 1
+        )
+        for field_data in regmap:
+            self._regmap_by_num[field_data.reg] = field_data
 
     @abstractmethod
     def read_fields(self, fields: List[str]) -> Dict[str, Any]:
@@ -578,28 +615,51 @@ class MmpsuV2Base(ABC):
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
-def get_payload_size(packet: bytearray | bytes) -> int:
+_LEN_STRUCT = struct.Struct("<H")
+_HDR_STRUCT = struct.Struct("<BBH")
+_CRC_STRUCT = struct.Struct(">H")
+
+
+def get_payload_size(packet: bytes | bytearray | memoryview) -> int:
     """Extract the payload length from the given packet. You can actually
     pass in just a header."""
-    return packet[PAYLOAD_LEN_L_IND] | (packet[PAYLOAD_LEN_H_IND] << 8)
+    length: int = _LEN_STRUCT.unpack_from(packet, PAYLOAD_LEN_L_IND)[0]
+    return length
 
 
-def get_packet_size(packet: bytearray | bytes) -> int:
+def get_packet_size(packet: bytes | bytearray | memoryview) -> int:
     """Extract the expected packet size from the given packet based on the
     header. You can actually pass in just a header"""
-    return get_payload_size(packet) + HDDR_SIZE + CRC_SIZE
+    length: int = _LEN_STRUCT.unpack_from(packet, PAYLOAD_LEN_L_IND)[0]
+    return length + HDDR_SIZE + CRC_SIZE
 
 
-def set_packet_size(packet: bytearray | bytes, length: int):
+def set_packet_size(packet: bytearray | memoryview, length: int) -> None:
     """Pack the packet size into the header of the given packet"""
-    packet[PAYLOAD_LEN_L_IND] = length & 0xFF
-    packet[PAYLOAD_LEN_H_IND] = (length >> 8) & 0xFF
+    _LEN_STRUCT.pack_into(packet, PAYLOAD_LEN_L_IND, length)
 
 
-def get_checksum(packet: bytearray | bytes) -> int:
+def set_header(packet: bytearray | memoryview, cmd: int, length: int) -> None:
+    """Pack the start byte, command and payload size into the header of the
+    given packet"""
+    _HDR_STRUCT.pack_into(packet, 0, START_BYTE, cmd, length)
+
+
+def get_checksum(packet: bytes | bytearray | memoryview) -> int:
     """Extract the checksum from the packet"""
-    ind = HDDR_SIZE + get_payload_size(packet)
-    return (packet[ind] << 8) | packet[ind + 1]
+    chksum: int = _CRC_STRUCT.unpack_from(packet, HDDR_SIZE + get_payload_size(packet))[0]
+    return chksum
+
+
+def set_checksum(packet: bytearray | memoryview, chksum: int) -> None:
+    """Pack the checksum into the packet, after its payload"""
+    _CRC_STRUCT.pack_into(packet, HDDR_SIZE + get_payload_size(packet), chksum)
+
+
+def crc16(data: bytearray | bytes | memoryview) -> int:
+    """Compute the CRC over all of data. binascii.crc_hqx is this CRC
+    implemented in C, and takes memoryviews without copying."""
+    return binascii.crc_hqx(data, CRC16_INIT)
 
 
 def get_alarm_string(alarms: int) -> str:
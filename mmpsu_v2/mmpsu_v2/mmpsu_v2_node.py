@@ -1,3 +1,5 @@
+from typing import Any, List
+
 import rclpy
 from rclpy.node import Node
 from rclpy.exceptions import ParameterNotDeclaredException
@@ -11,6 +13,9 @@ from mmpsu_v2_interfaces.srv import SetFloat32
 
 from mmpsu_v2_interfaces.msg import MmpsuCoreTelem, MmpsuAuxTelem
 
+# per-phase bools for every value of a 6-bit phase bit-field, phase A first
+_BITS6 = [tuple(bool((x >> i) & 1) for i in range(6)) for x in range(64)]
+
 
 class MmpsuV2Node(Node):
     """MMPSU v2 ROS 2 node"""
@@ -52,6 +57,11 @@ class MmpsuV2Node(Node):
         "ALARMS",
     ]
 
+    # register numbers of the core fields, checked on each read. A READ of n
+    # fields moves 12 + 6n bytes against 257 for READ_ALL, so READ is the
+    # cheaper request for these 31 fields (only above ~41 would READ_ALL win)
+    CORE_TELEM_REGS = [int(mmpsu_base.MmpsuV2RegMap[f]) for f in CORE_TELEM_FIELDS]
+
     # fields that need to be pulled for an aux telemetry message
     AUX_TELEM_FIELDS = [
         "COMMS_ERROR_COUNT",
@@ -98,10 +108,15 @@ class MmpsuV2Node(Node):
             type=ParameterType.PARAMETER_DOUBLE,
             description="Period for polling the auxilliary telemetry fields.",
         )
+        check_crc_param_desc = ParameterDescriptor(
+            type=ParameterType.PARAMETER_BOOL,
+            description="Reject packets from the MMPSU whose CRC doesn't match.",
+        )
 
         self.declare_parameter("core_telem_period", None, core_telem_param_desc)
         self.declare_parameter("uart_path", None, uart_path_param_desc)
         self.declare_parameter("aux_telem_period", None, aux_telem_param_desc)
+        self.declare_parameter("check_crc", None, check_crc_param_desc)
 
         try:
             self.core_status_period = (
@@ -122,7 +137,14 @@ class MmpsuV2Node(Node):
         except ParameterNotDeclaredException:
             self.aux_telem_period = 0.5
 
-        self._mmpsu = mmpsu_v2_uart.MmpsuV2Uart(self.uart_path, self.get_logger())
+        try:
+            self.check_crc = self.get_parameter("check_crc").get_parameter_value().bool_value
+        except ParameterNotDeclaredException:
+            self.check_crc = False
+
+        self._mmpsu = mmpsu_v2_uart.MmpsuV2Uart(
+            self.uart_path, self.get_logger(), check_crc=self.check_crc
+        )
 
         if self._mmpsu.test_comms():
             self.get_logger().info("MMPSU test comms succeeded.")
@@ -133,43 +155,20 @@ class MmpsuV2Node(Node):
         self.core_timer = self.create_timer(self.core_status_period, self.status_timer_callback)
         self.aux_timer = self.create_timer(self.aux_telem_period, self.aux_telem_timer_callback)
 
-    def status_timer_callback(self):
-        msg = MmpsuCoreTelem()
-
-        fields = self._mmpsu.read_fields(self.CORE_TELEM_FIELDS)
+    def destroy_node(self) -> None:
+        self._mmpsu.close()
+        super().destroy_node()
 
-        try:
-            msg.output_enabled = fields["OUTPUT_ENABLED"]
-            msg.vout_measured = float(fields["VOUT_MEASURED"]) / 1000.0
-            msg.vout_setpoint = float(fields["VOUT_SETPOINT"]) / 1000.0
-
-            iout_total = 0.0
-
-            phases_present = fields["PHASES_PRESENT"]
-            phases_enabled = fields["PHASES_ENABLED"]
-            phases_overtemped = fields["PHASES_IN_OVERTEMP"]
-            for phase_ind in range(0, 6):
-                present = bool((phases_present >> phase_ind) & 1)
-                msg.phase_present[phase_ind] = present
-                if present:
-                    msg.phase_enabled[phase_ind] = bool((phases_enabled >> phase_ind) & 1)
-                    msg.phase_overtemp[phase_ind] = bool((phases_overtemped >> phase_ind) & 1)
-                    letter = self.PHASE_MAPPING[phase_ind]
-                    msg.phase_duty_cycle[phase_ind] = (
-                        float(fields[f"PHASE_{letter}_DUTY_CYCLE"]) / 5440.0
-                    )
-                    iout_phase = float(fields[f"PHASE_{letter}_CURRENT"]) / 1000.0
-                    msg.phase_current[phase_ind] = iout_phase
-                    iout_total += iout_phase
-                    msg.phase_current_limit[phase_ind] = (
-                        float(fields[f"PHASE_{letter}_CURRENT_LIMIT"]) / 1000.0
-                    )
-                    msg.phase_temp[phase_ind] = fields[f"PHASE_{letter}_TEMP"]
-            msg.iout_measured = iout_total
-            msg.alarms = mmpsu_base.get_alarm_string(fields["ALARMS"])
+    def status_timer_callback(self):
+        # values indexed by register number, which saves hashing field names
+        regs = self._mmpsu.read_fields_by_reg(self.CORE_TELEM_FIELDS)
 
-        except KeyError:
+        # an empty list if the read failed, None for fields not returned
+        if not regs or any(regs[r] is None for r in self.CORE_TELEM_REGS):
             self._logger.warning("Not all core telemetry fields read.")
+            msg = MmpsuCoreTelem()
+        else:
+            msg = build_core_telem_msg(regs)
 
         self.core_telem_pub.publish(msg)
 
@@ -244,6 +243,47 @@ class MmpsuV2Node(Node):
             return min_val
 
 
+# register numbers of each phase's duty cycle, current, current limit and
+# temperature, phase A first, so the per-tick decode formats no keys
+_PHASE_REGS = [
+    tuple(
+        int(mmpsu_base.MmpsuV2RegMap[f"PHASE_{letter}_{suffix}"])
+        for suffix in ("DUTY_CYCLE", "CURRENT", "CURRENT_LIMIT", "TEMP")
+    )
+    for letter in MmpsuV2Node.PHASE_MAPPING.values()
+]
+
+
+def build_core_telem_msg(regs: List[Any]) -> MmpsuCoreTelem:
+    """Build a core telemetry message from a list of register values indexed
+    by register number. Every register in CORE_TELEM_FIELDS must be present."""
+    msg = MmpsuCoreTelem()
+    reg = mmpsu_base.MmpsuV2RegMap
+
+    msg.output_enabled = regs[reg.OUTPUT_ENABLED]
+    msg.vout_measured = float(regs[reg.VOUT_MEASURED]) / 1000.0
+    msg.vout_setpoint = float(regs[reg.VOUT_SETPOINT]) / 1000.0
+
+    iout_total = 0.0
+
+    present = regs[reg.PHASES_PRESENT] & 0x3F
+    present_bits = _BITS6[present]
+    msg.phase_present = present_bits
+    msg.phase_enabled = _BITS6[regs[reg.PHASES_ENABLED] & present]
+    msg.phase_overtemp = _BITS6[regs[reg.PHASES_IN_OVERTEMP] & present]
+    for phase_ind, (duty_reg, current_reg, limit_reg, temp_reg) in enumerate(_PHASE_REGS):
+        if present_bits[phase_ind]:
+            msg.phase_duty_cycle[phase_ind] = float(regs[duty_reg]) / 5440.0
+            iout_phase = float(regs[current_reg]) / 1000.0
+            msg.phase_current[phase_ind] = iout_phase
+            iout_total += iout_phase
+            msg.phase_current_limit[phase_ind] = float(regs[limit_reg]) / 1000.0
+            msg.phase_temp[phase_ind] = regs[temp_reg]
+    msg.iout_measured = iout_total
+    msg.alarms = mmpsu_base.get_alarm_string(regs[reg.ALARMS])
+    return msg
+
+
 def main(args=None):
     rclpy.init(args=args)
 
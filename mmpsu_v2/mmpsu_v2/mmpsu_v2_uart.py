@@ -2,11 +2,86 @@
 
 import mmpsu_v2.mmpsu_base as mmpsu
 import serial
-from typing import Dict, List, Any
-from threading import Lock
+import struct
+from functools import lru_cache
+from queue import Empty, SimpleQueue
+from typing import Any, Callable, Dict, List, Tuple
+from threading import Lock, Thread
 from rclpy.impl.rcutils_logger import RcutilsLogger
 
 
+@lru_cache(maxsize=None)
+def _read_request_struct(n_fields: int) -> struct.Struct:
+    """Struct for the header and register numbers of a READ request."""
+    return struct.Struct(f"<BBH{n_fields}B")
+
+
+class _FrameParser:
+    """Splits a raw byte stream from the MMPSU into packets. Anything before a
+    start byte is skipped, so a dropped or corrupted byte costs at most the
+    packet it was part of rather than the framing of everything after it."""
+
+    WAIT_START = 0
+    READ_HDR = 1
+    READ_BODY = 2
+
+    _VALID_CMDS = frozenset(int(cmd) for cmd in mmpsu.MmpsuV2Commands)
+
+    # a READ_ALL reply, a record for every register, is the largest packet
+    MAX_PACKET_SIZE = mmpsu.HDDR_SIZE + 5 * len(mmpsu.MMPSU_V2_REGS) + mmpsu.CRC_SIZE
+
+    def __init__(self) -> None:
+        self._state = self.WAIT_START
+        self._hddr = bytearray(mmpsu.HDDR_SIZE)
+        self._buf = self._hddr
+        self._filled = 0
+
+    def reset(self) -> None:
+        """Drop any partially received packet."""
+        self._state = self.WAIT_START
+
+    def feed(self, data: bytes) -> List[bytearray]:
+        """Consume received bytes, returning any packets they complete. Each
+        packet is copied once, straight into a bytearray of its final size."""
+        frames = []
+        view = memoryview(data)
+        pos = 0
+        while pos < len(data):
+            if self._state == self.WAIT_START:
+                pos = data.find(mmpsu.START_BYTE, pos)
+                if pos < 0:
+                    break
+                self._buf = self._hddr
+                self._filled = 0
+                self._state = self.READ_HDR
+
+            buf = self._buf
+            count = min(len(buf) - self._filled, len(data) - pos)
+            buf[self._filled : self._filled + count] = view[pos : pos + count]
+            self._filled += count
+            pos += count
+            if self._filled < len(buf):
+                break
+
+            if self._state == self.READ_HDR:
+                if (
+                    buf[mmpsu.CMD_IND] not in self._VALID_CMDS
+                    or mmpsu.get_packet_size(buf) > self.MAX_PACKET_SIZE
+                ):
+                    # not really a header, look for a start byte inside it
+                    self._state = self.WAIT_START
+                    frames += self.feed(bytes(buf[1:]))
+                    continue
+                self._buf = bytearray(mmpsu.get_packet_size(buf))
+                self._buf[: mmpsu.HDDR_SIZE] = buf
+                self._state = self.READ_BODY
+            else:
+                frames.append(buf)
+                self._state = self.WAIT_START
+
+        return frames
+
+
 class MmpsuV2Uart(mmpsu.MmpsuV2Base):
     """Communicate with and control the MMPSU via a generic UART"""
 
@@ -16,7 +91,14 @@ class MmpsuV2Uart(mmpsu.MmpsuV2Base):
     MAX_PHASE_CURR_LIMIT = 32.0
     MIN_PHASE_CURR_LIMIT = 0.0
 
-    def __init__(self, comport: str, logger: RcutilsLogger):
+    # size of the reusable TX packet buffer. A WRITE of every register, a
+    # 5-byte record each, is the largest packet sent
+    MAX_TX_PACKET_SIZE = mmpsu.HDDR_SIZE + 5 * len(mmpsu.MMPSU_V2_REGS) + mmpsu.CRC_SIZE
+
+    # payload the MMPSU should echo back for CMD_TEST_COMMS
+    TEST_COMMS_PAYLOAD = b"\xDE\xAD\xBE\xEF"
+
+    def __init__(self, comport: str, logger: RcutilsLogger, check_crc: bool = False):
         super().__init__(mmpsu.MMPSU_V2_REGS)
         self._ser = serial.Serial(comport)
         self._ser.baudrate = mmpsu.MMPSU_UART_BAUD
@@ -24,45 +106,67 @@ class MmpsuV2Uart(mmpsu.MmpsuV2Base):
         self.logger = logger
         self._rx_crc_err_count = 0
         self._mmpsu_crc_err_count = 0
+        # the firmware's CRC hasn't been confirmed against a real device, so
+        # received CRCs are only enforced when asked for. Sent packets always
+        # carry one.
+        self._check_rx_crc = check_crc
 
         if not self._ser.is_open:
             self._ser.open()
 
         self._uart_lock = Lock()
+        # scratch buffer for building TX packets, protected by _uart_lock
+        self._tx_buf = bytearray(self.MAX_TX_PACKET_SIZE)
+        # compiled payload structs for repeated writes of the same fields
+        self._write_struct = lru_cache(maxsize=32)(self._build_write_struct)
+
+        self._reg_by_name = {name: int(fd.reg) for name, fd in self._regmap.items()}
+        # None for register numbers with no field, which replies never hold
+        self._unpack_by_num: List[Callable[[memoryview, int], Any] | None] = [
+            fd.unpack_from if fd is not None else None for fd in self._regmap_by_num
+        ]
+
+        # a READ_ALL reply holds every register in order, so it can be unpacked
+        # in one go with a struct built for that whole layout
+        self._read_all_regs = list(range(len(self._regmap_by_num)))
+        self._read_all_names = [fd.name if fd is not None else "" for fd in self._regmap_by_num]
+        read_all_fmts = [fd.pack_fmt if fd is not None else "" for fd in self._regmap_by_num]
+        self._read_all_struct: struct.Struct | None = None
+        if all(read_all_fmts):
+            self._read_all_struct = struct.Struct("<" + "".join(read_all_fmts))
+
+        # packets that never change, built once and reused
+        self._test_comms_packet = self._build_packet(
+            mmpsu.MmpsuV2Commands.CMD_TEST_COMMS, self.TEST_COMMS_PAYLOAD
+        )
+        self._read_all_packet = self._build_packet(mmpsu.MmpsuV2Commands.CMD_READ_ALL, b"")
+
+        # received bytes are framed by a background thread so that waiting
+        # on the UART doesn't happen in the caller's thread
+        self._rx_timeout = self._ser.timeout
+        self._rx_frames: SimpleQueue[bytearray] = SimpleQueue()
+        self._rx_resync = False
+        self._rx_stop = False
+        # why the receive thread died, None while it's running
+        self._rx_error: BaseException | None = None
+        self._rx_thread = Thread(target=self._rx_loop, name="mmpsu_uart_rx", daemon=True)
+        self._rx_thread.start()
 
     def test_comms(self) -> bool:
         """Test comms interface, return true on success, false on failure."""
-        payload_len = 4
-        total_len = mmpsu.HDDR_SIZE + payload_len + mmpsu.CRC_SIZE
-        packet = bytearray(total_len)
-        packet[0] = mmpsu.START_BYTE
-        packet[mmpsu.CMD_IND] = mmpsu.MmpsuV2Commands.CMD_TEST_COMMS
-        packet[mmpsu.HDDR_SIZE] = 0xDE
-        packet[mmpsu.HDDR_SIZE + 1] = 0xAD
-        packet[mmpsu.HDDR_SIZE + 2] = 0xBE
-        packet[mmpsu.HDDR_SIZE + 3] = 0xEF
-        mmpsu.set_packet_size(packet, payload_len)
-        self._add_crc(packet)
-        s = ""
-        for b in packet:
-            s += f"{b:02X} "
+        packet = self._test_comms_packet
 
         with self._uart_lock:
-            if not self._send_packet(packet):
+            if not self._write(packet):
                 return False
 
             rpy = self._read_packet()
-            s = ""
-            for b in rpy:
-                s += f"{b:02X} "
-
             if not self._verify_packet(packet, rpy):
                 return False
 
-            if (
-                rpy[mmpsu.HDDR_SIZE : mmpsu.HDDR_SIZE + mmpsu.get_payload_size(rpy)]
-                != packet[mmpsu.HDDR_SIZE : mmpsu.HDDR_SIZE + mmpsu.get_payload_size(packet)]
-            ):
+            rpy_end = mmpsu.HDDR_SIZE + mmpsu.get_payload_size(rpy)
+            if memoryview(rpy)[mmpsu.HDDR_SIZE : rpy_end] != self.TEST_COMMS_PAYLOAD:
+                self.logger.warning(f"Test comms echo mismatch: {rpy.hex(' ')}")
                 return False
 
         return True
@@ -70,23 +174,23 @@ class MmpsuV2Uart(mmpsu.MmpsuV2Base):
     def write_fields(self, field_values: Dict[str, Any]) -> bool:
         """Write a dictionary of reg_name:value pairs to the MMPSU. Returns
         True once a valid reply packet has been received from mmpsu."""
-        payload_len = 5 * len(field_values)
-        total_len = mmpsu.HDDR_SIZE + payload_len + mmpsu.CRC_SIZE
-        packet = bytearray(total_len)
-        offset = mmpsu.HDDR_SIZE
-        for field, data in field_values.items():
-            offset += self._regmap[field].pack_into(packet, data, offset)
-
-        if offset != mmpsu.HDDR_SIZE + payload_len:
+        payload_struct = self._write_struct(tuple(field_values))
+        if payload_struct is None:
             # something is wrong
             return False
 
-        packet[0] = mmpsu.START_BYTE
-        packet[mmpsu.CMD_IND] = mmpsu.MmpsuV2Commands.CMD_WRITE
-        mmpsu.set_packet_size(packet, payload_len)
-        self._add_crc(packet)
+        payload_len = payload_struct.size
+        args = []
+        for field, data in field_values.items():
+            args.append(self._regmap[field].reg)
+            args.append(data)
 
         with self._uart_lock:
+            packet = self._get_tx_buf(mmpsu.HDDR_SIZE + payload_len + mmpsu.CRC_SIZE)
+            mmpsu.set_header(packet, mmpsu.MmpsuV2Commands.CMD_WRITE, payload_len)
+            payload_struct.pack_into(packet, mmpsu.HDDR_SIZE, *args)
+            self._add_crc(packet)
+
             if not self._send_packet(packet):
                 return False
             # we care if the MMPSU returns an error
@@ -99,41 +203,64 @@ class MmpsuV2Uart(mmpsu.MmpsuV2Base):
     def read_fields(self, fields: List[str]) -> Dict[str, Any]:
         """Read a list of registers given by fields, and return a dictionary
         of reg_name:value pairs."""
-        payload_len = len(fields)
-        total_len = mmpsu.HDDR_SIZE + payload_len + mmpsu.CRC_SIZE
-        packet = bytearray(total_len)
-        packet[0] = mmpsu.START_BYTE
-        packet[mmpsu.CMD_IND] = mmpsu.MmpsuV2Commands.CMD_READ
-        mmpsu.set_packet_size(packet, payload_len)
-
-        ind = mmpsu.HDDR_SIZE
-        for regstr in fields:
-            packet[ind] = self._regmap[regstr].reg
-            ind += 1
+        rpy_pack = self._read_request(fields)
+        if not rpy_pack:
+            return {}
+        return self._parse_read_packet(rpy_pack)
 
-        self._add_crc(packet)
+    def read_fields_by_reg(self, fields: List[str]) -> List[Any]:
+        """Read a list of registers given by fields, and return a list of
+        values indexed by register number. Registers not read are None, and
+        the list is empty on failure."""
+        rpy_pack = self._read_request(fields)
+        if not rpy_pack:
+            return []
+        return self._parse_read_packet_by_reg(rpy_pack)
+
+    def _read_request(self, fields: List[str]) -> bytearray:
+        """Send a READ command for the given fields, and return the verified
+        reply packet, or an empty bytearray on failure."""
+        payload_len = len(fields)
+        # the reply holds a 5-byte record per field, and the receiver drops
+        # anything bigger than the largest valid packet
+        rpy_size = mmpsu.HDDR_SIZE + 5 * payload_len + mmpsu.CRC_SIZE
+        if rpy_size > _FrameParser.MAX_PACKET_SIZE:
+            self.logger.error(
+                f"Can't read {payload_len} fields at once, the reply would be {rpy_size} "
+                f"bytes (max {_FrameParser.MAX_PACKET_SIZE})."
+            )
+            return bytearray()
+        reg_by_name = self._reg_by_name
+        regnums = [reg_by_name[regstr] for regstr in fields]
 
         with self._uart_lock:
+            packet = self._get_tx_buf(mmpsu.HDDR_SIZE + payload_len + mmpsu.CRC_SIZE)
+            _read_request_struct(payload_len).pack_into(
+                packet,
+                0,
+                mmpsu.START_BYTE,
+                mmpsu.MmpsuV2Commands.CMD_READ,
+                payload_len,
+                *regnums,
+            )
+            self._add_crc(packet)
+
             if not self._send_packet(packet):
-                return {}
+                return bytearray()
 
             rpy_pack = self._read_packet()
             if not self._verify_packet(packet, rpy_pack):
-                return {}
+                return bytearray()
 
-        return self._parse_read_packet(rpy_pack)
+        return rpy_pack
 
     def read_all_fields(self) -> Dict[str, Any]:
         """Issue the READ_ALL command, reading ALL fields, and return the
         result as a dictionary of reg_name:value pairs."""
-        packet = bytearray(mmpsu.HDDR_SIZE + mmpsu.CRC_SIZE)
-        packet[0] = mmpsu.START_BYTE
-        packet[mmpsu.CMD_IND] = mmpsu.MmpsuV2Commands.CMD_READ_ALL
-        mmpsu.set_packet_size(packet, 0)
-        self._add_crc(packet)
+        packet = self._read_all_packet
 
         with self._uart_lock:
-            if not self._send_packet(packet):
+            if not self._write(packet):
                 return {}
 
             rpy_pack = self._read_packet()
@@ -141,27 +268,63 @@ class MmpsuV2Uart(mmpsu.MmpsuV2Base):
             if not self._verify_packet(packet, rpy_pack):
                 return {}
 
+        payload_len = mmpsu.get_payload_size(rpy_pack)
+        payload = memoryview(rpy_pack)[mmpsu.HDDR_SIZE : mmpsu.HDDR_SIZE + payload_len]
+        values = self._unpack_read_all(payload)
+        if values is not None:
+            return dict(zip(self._read_all_names, values))
         return self._parse_read_packet(rpy_pack)
 
-    def _verify_packet(self, tx_packet: bytearray, rx_packet: bytearray) -> bool:
+    def close(self) -> None:
+        """Stop the receive thread and close the UART. Requests made after
+        this fail."""
+        with self._uart_lock:
+            self._rx_stop = True
+            # a read returns within the port timeout, so this won't block long
+            self._rx_thread.join(timeout=2 * self._ser.timeout)
+            self._ser.close()
+
+    def _build_packet(self, cmd: mmpsu.MmpsuV2Commands, payload: bytes) -> bytes:
+        """Build a complete packet, CRC included, for the given command and
+        payload."""
+        packet = bytearray(mmpsu.HDDR_SIZE + len(payload) + mmpsu.CRC_SIZE)
+        mmpsu.set_header(packet, cmd, len(payload))
+        packet[mmpsu.HDDR_SIZE : mmpsu.HDDR_SIZE + len(payload)] = payload
+        self._add_crc(packet)
+        return bytes(packet)
+
+    def _build_write_struct(self, fields: Tuple[str, ...]) -> struct.Struct | None:
+        """Build one struct packing the reg number and value of every field in
+        fields, in order. Returns None if any of the fields can't be packed."""
+        fmts = [self._regmap[field].pack_fmt for field in fields]
+        if not all(fmts):
+            return None
+        return struct.Struct("<" + "".join(fmts))
+
+    def _verify_packet(
+        self, tx_packet: bytes | bytearray | memoryview, rx_packet: bytes | bytearray | memoryview
+    ) -> bool:
         """Verify that a received packet passes CRC check and match packet
         type. If not, print relevant error message."""
-        if len(rx_packet) < mmpsu.HDDR_SIZE + mmpsu.CRC_SIZE:
+        hddr_size, cmd_ind = mmpsu.HDDR_SIZE, mmpsu.CMD_IND
+        if len(rx_packet) < hddr_size + mmpsu.CRC_SIZE:
             # minimum packet is a header and CRC zero-length payload
             return False
 
-        if not self._check_crc(rx_packet):
+        if self._check_rx_crc and not self._check_crc(rx_packet):
             self._rx_crc_err_count += 1
             self.logger.warning("Rx CRC Error.")
             return False
 
-        if rx_packet[mmpsu.CMD_IND] != tx_packet[mmpsu.CMD_IND]:
-            if rx_packet[mmpsu.CMD_IND] == mmpsu.MmpsuV2Commands.CMD_ERROR:
+        rx_cmd = rx_packet[cmd_ind]
+        if rx_cmd != tx_packet[cmd_ind]:
+            if rx_cmd == mmpsu.MmpsuV2Commands.CMD_ERROR:
                 # some error occured, print error code
-                self.logger.warning(
-                    f"Comms error: {mmpsu.MMPSU_ERR_CODES[rx_packet[mmpsu.HDDR_SIZE]]}"
-                )
-                if rx_packet[mmpsu.HDDR_SIZE] == mmpsu.MmpsuV2ErrorCodes.ERR_CRC:
+                err_codes = mmpsu.MMPSU_ERR_CODES
+                err_code = rx_packet[hddr_size]
+                err_str = err_codes[err_code] if err_code < len(err_codes) else str(err_code)
+                self.logger.warning(f"Comms error: {err_str}")
+                if err_code == mmpsu.MmpsuV2ErrorCodes.ERR_CRC:
                     self._mmpsu_crc_err_count += 1
             else:
                 # other unexpected packet type received
@@ -170,63 +333,132 @@ class MmpsuV2Uart(mmpsu.MmpsuV2Base):
 
         return True
 
-    def _parse_read_packet(self, packet) -> Dict[str, Any]:
+    def _parse_read_packet(self, packet: bytes | bytearray | memoryview) -> Dict[str, Any]:
         """Parse a response to a READ command."""
         payload_len = mmpsu.get_payload_size(packet)
-        payload = packet[mmpsu.HDDR_SIZE : mmpsu.HDDR_SIZE + payload_len]
+        payload = memoryview(packet)[mmpsu.HDDR_SIZE : mmpsu.HDDR_SIZE + payload_len]
+        names_by_num = self._read_all_names
+        unpack_by_num = self._unpack_by_num
         retval = {}
+        for i in range(0, payload_len, 5):  # 5 is the size of reg_num and value
+            regnum = payload[i]
+            unpack = unpack_by_num[regnum]
+            if unpack is not None:
+                retval[names_by_num[regnum]] = unpack(payload, i + 1)
 
+        return retval
+
+    def _parse_read_packet_by_reg(self, packet: bytes | bytearray | memoryview) -> List[Any]:
+        """Parse a response to a READ command into a list indexed by register
+        number."""
+        payload_len = mmpsu.get_payload_size(packet)
+        payload = memoryview(packet)[mmpsu.HDDR_SIZE : mmpsu.HDDR_SIZE + payload_len]
+        unpack_by_num = self._unpack_by_num
+        retval: List[Any] = [None] * len(unpack_by_num)
         for i in range(0, payload_len, 5):  # 5 is the size of reg_num and value
             regnum = payload[i]
-            retval[self._regmap_by_num[regnum].name] = self._regmap_by_num[regnum].unpack_from(
-                payload, i + 1
-            )
+            unpack = unpack_by_num[regnum]
+            if unpack is not None:
+                retval[regnum] = unpack(payload, i + 1)
 
         return retval
 
+    def _unpack_read_all(self, payload: memoryview) -> List[Any] | None:
+        """Unpack a payload holding every register in order with a single
+        struct call, returning the values indexed by register number. Returns
+        None if the payload isn't laid out that way."""
+        read_all_struct = self._read_all_struct
+        if read_all_struct is None or len(payload) != read_all_struct.size:
+            return None
+        records = read_all_struct.unpack_from(payload)
+        if list(records[0::2]) != self._read_all_regs:
+            return None
+        return list(records[1::2])
+
     def _send_packet(self, packet: bytearray) -> bool:
-        """Send a packet, return False if packet is malformed and True on
-        success."""
+        """Send a packet, return False if packet is malformed or the UART is
+        closed and True on success."""
         send_size = mmpsu.get_packet_size(packet)
-        if send_size < len(packet):
+        if send_size > len(packet):
             # malformed packet
             return False
         # only send as much as we need to send
-        self._ser.write(packet[:send_size])
+        return self._write(memoryview(packet)[:send_size])
+
+    def _get_tx_buf(self, size: int) -> bytearray:
+        """Get a buffer of at least size bytes to build a TX packet in. This is
+        the shared scratch buffer whenever it is big enough, so only call it
+        with the UART lock held and finish with the packet before releasing
+        the lock."""
+        if size <= len(self._tx_buf):
+            return self._tx_buf
+        return bytearray(size)
+
+    def _write(self, packet: bytes | bytearray | memoryview) -> bool:
+        """Write raw bytes to the UART, first discarding any stale packets
+        (e.g. late replies to a request that already timed out) so the next
+        packet read is the reply to this one. Returns False if the UART has
+        been closed."""
+        if self._rx_stop:
+            self.logger.warning("UART is closed.")
+            return False
+        while not self._rx_frames.empty():
+            self._rx_frames.get_nowait()
+        self._ser.write(packet)
         return True
 
+    def _rx_loop(self) -> None:
+        """Continuously frame bytes from the UART into received packets."""
+        parser = _FrameParser()
+        while not self._rx_stop:
+            try:
+                data = self._ser.read(self._ser.in_waiting or 1)
+            except (serial.SerialException, OSError, TypeError) as e:
+                # pyserial raises TypeError/OSError if the port goes away mid-read
+                if not self._rx_stop:
+                    self._rx_error = e
+                    self.logger.error(f"UART read failed, stopping receive thread. {e}")
+                return
+
+            if self._rx_resync or not data:
+                # a reply timed out or the line went quiet, so whatever was
+                # partially received is never going to be completed
+                parser.reset()
+                self._rx_resync = False
+
+            for frame in parser.feed(data):
+                self._rx_frames.put(frame)
+
     def _read_packet(self) -> bytearray:
         """Read an incoming packet, return an empty bytearray on timeout."""
-        hddr = self._ser.read(mmpsu.HDDR_SIZE)
-        try:
-            payload_len = mmpsu.get_payload_size(bytearray(hddr))
-        except IndexError:
-            # presumably a timeout
-            self.logger.warning(f"Read packet timeout. {hddr}")
+        if not self._rx_thread.is_alive():
+            # nothing will ever arrive, so don't wait out the timeout
+            self.logger.error(f"UART receive thread not running. {self._rx_error}")
             return bytearray()
 
-        payload_and_crc = self._ser.read(payload_len + mmpsu.CRC_SIZE)
-
-        return bytearray(hddr + payload_and_crc)
+        try:
+            return self._rx_frames.get(timeout=self._rx_timeout)
+        except Empty:
+            self._rx_resync = True
+            self.logger.warning("Read packet timeout.")
+            return bytearray()
 
-    def _compute_crc(self, payload: bytearray):
-        """Compute CRC over the entire payload array. payload argument should
-        be only the payload and nothing else"""
-        return 0
+    def _compute_crc(self, buf: bytes | bytearray | memoryview, start: int, end: int) -> int:
+        """Compute CRC over buf[start:end], which should be just the payload.
+        Reads straight from buf rather than copying the payload out."""
+        return mmpsu.crc16(memoryview(buf)[start:end])
 
-    def _add_crc(self, packet: bytearray | bytes):
+    def _add_crc(self, packet: bytearray | memoryview) -> None:
         """Stuff the packet's CRC bits with the computed CRC."""
         chksum_ind = mmpsu.HDDR_SIZE + mmpsu.get_payload_size(packet)
-        chksum = self._compute_crc(packet[mmpsu.HDDR_SIZE : chksum_ind])
-        packet[chksum_ind] = (chksum >> 8) & 0xFF
-        packet[chksum_ind + 1] = chksum & 0xFF
+        mmpsu.set_checksum(packet, self._compute_crc(packet, mmpsu.HDDR_SIZE, chksum_ind))
 
-    def _check_crc(self, packet: bytearray | bytes) -> bool:
+    def _check_crc(self, packet: bytes | bytearray | memoryview) -> bool:
         """Verify that the received checksum matches a computed checksum over
         the received payload."""
         rx_chk = mmpsu.get_checksum(packet)
         chksum_ind = mmpsu.HDDR_SIZE + mmpsu.get_payload_size(packet)
-        expect_chk = self._compute_crc(packet[mmpsu.HDDR_SIZE : chksum_ind])
+        expect_chk = self._compute_crc(packet, mmpsu.HDDR_SIZE, chksum_ind)
         return rx_chk == expect_chk
 
     @property
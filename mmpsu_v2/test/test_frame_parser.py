@@ -0,0 +1,207 @@
+import queue
+
+from mmpsu_v2 import mmpsu_base as mmpsu
+from mmpsu_v2 import mmpsu_v2_uart
+from mmpsu_v2.mmpsu_v2_uart import _FrameParser
+
+
+def _packet(cmd, payload):
+    packet = bytearray(mmpsu.HDDR_SIZE + len(payload) + mmpsu.CRC_SIZE)
+    mmpsu.set_header(packet, cmd, len(payload))
+    packet[mmpsu.HDDR_SIZE : mmpsu.HDDR_SIZE + len(payload)] = payload
+    mmpsu.set_checksum(packet, mmpsu.crc16(payload))
+    return bytes(packet)
+
+
+TEST_COMMS = _packet(mmpsu.MmpsuV2Commands.CMD_TEST_COMMS, b"\xDE\xAD\xBE\xEF")
+READ_RPY = _packet(mmpsu.MmpsuV2Commands.CMD_READ, b"\x01\x10\x27\x00\x00")
+
+
+def test_single_packet():
+    assert _FrameParser().feed(TEST_COMMS) == [TEST_COMMS]
+
+
+def test_chunked_input():
+    stream = TEST_COMMS + READ_RPY + TEST_COMMS
+    for step in range(1, len(stream) + 1):
+        parser = _FrameParser()
+        frames = []
+        for i in range(0, len(stream), step):
+            frames += parser.feed(stream[i : i + step])
+        assert frames == [TEST_COMMS, READ_RPY, TEST_COMMS], step
+
+
+def test_leading_garbage_skipped():
+    assert _FrameParser().feed(b"\x00\x13\x37" + READ_RPY) == [READ_RPY]
+
+
+def test_bad_header_refeeds_from_next_byte():
+    # the first a5 is followed by an invalid command, so the real start byte
+    # is inside the rejected header and has to be found again
+    stream = b"\xA5\xA5" + TEST_COMMS
+    assert _FrameParser().feed(stream) == [TEST_COMMS]
+
+    # same again with the bytes arriving one at a time
+    parser = _FrameParser()
+    frames = []
+    for i in range(len(stream)):
+        frames += parser.feed(stream[i : i + 1])
+    assert frames == [TEST_COMMS]
+
+
+def test_oversize_length_rejected():
+    # a valid command with a length no packet can have
+    bogus = bytearray(mmpsu.HDDR_SIZE)
+    mmpsu.set_header(bogus, mmpsu.MmpsuV2Commands.CMD_READ, 0xFFFF)
+    parser = _FrameParser()
+    assert parser.feed(bytes(bogus) + READ_RPY) == [READ_RPY]
+    assert parser.feed(TEST_COMMS) == [TEST_COMMS]
+
+
+def test_largest_packet_accepted():
+    payload = bytes(5 * len(mmpsu.MMPSU_V2_REGS))
+    packet = _packet(mmpsu.MmpsuV2Commands.CMD_READ_ALL, payload)
+    assert len(packet) == _FrameParser.MAX_PACKET_SIZE
+    assert _FrameParser().feed(packet) == [packet]
+
+
+def test_reset_drops_partial_packet():
+    parser = _FrameParser()
+    assert parser.feed(TEST_COMMS[:6]) == []
+    parser.reset()
+    assert parser.feed(READ_RPY) == [READ_RPY]
+
+
+class _FakeSerial:
+    """Serial port whose reads are served from a queue of chunks."""
+
+    def __init__(self, comport):
+        self.is_open = True
+        self.in_waiting = 0
+        self.timeout = None
+        self.baudrate = None
+        self.chunks = queue.SimpleQueue()
+        self.written = []
+        # packets sent back, one per write
+        self.replies = []
+
+    def read(self, size):
+        try:
+            return self.chunks.get(timeout=self.timeout)
+        except queue.Empty:
+            return b""
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        if self.replies:
+            self.chunks.put(self.replies.pop(0))
+        return len(data)
+
+    def close(self):
+        self.is_open = False
+
+
+class _Logger:
+    def warning(self, msg):
+        pass
+
+    def error(self, msg):
+        pass
+
+
+def _fake_uart(monkeypatch, **kwargs):
+    monkeypatch.setattr(mmpsu_v2_uart.serial, "Serial", _FakeSerial)
+    return mmpsu_v2_uart.MmpsuV2Uart("/dev/null", _Logger(), **kwargs)
+
+
+def test_timeout_resyncs_receiver(monkeypatch):
+    uart = _fake_uart(monkeypatch)
+    uart._rx_timeout = 0.05
+
+    # only part of a reply arrives, so the read times out
+    uart._ser.chunks.put(TEST_COMMS[:6])
+    assert uart._read_packet() == bytearray()
+
+    # the partial packet must not swallow the start of the next reply
+    uart._ser.chunks.put(READ_RPY)
+    uart._rx_timeout = 1.0
+    assert uart._read_packet() == READ_RPY
+    uart.close()
+
+
+def test_close_stops_receiver(monkeypatch):
+    uart = _fake_uart(monkeypatch)
+    uart.close()
+    assert not uart._rx_thread.is_alive()
+    assert not uart._ser.is_open
+
+
+def test_requests_fail_after_close(monkeypatch):
+    uart = _fake_uart(monkeypatch)
+    uart.close()
+    assert not uart.test_comms()
+    assert uart.read_fields(["VOUT_MEASURED"]) == {}
+    assert uart.read_fields_by_reg(["VOUT_MEASURED"]) == []
+    assert uart.read_all_fields() == {}
+    assert not uart.write_field("VOUT_SETPOINT", 12000)
+    assert uart._ser.written == []
+
+
+def test_read_fails_fast_after_rx_error(monkeypatch):
+    uart = _fake_uart(monkeypatch)
+
+    def broken_read(size):
+        raise OSError("device unplugged")
+
+    uart._ser.read = broken_read
+    uart._rx_thread.join(timeout=1.0)
+    assert isinstance(uart._rx_error, OSError)
+
+    # no more packets can arrive, so the read returns without waiting
+    uart._rx_timeout = 30.0
+    assert uart._read_packet() == bytearray()
+
+
+def _bad_crc(packet):
+    packet = bytearray(packet)
+    packet[-1] ^= 0xFF
+    return bytes(packet)
+
+
+def test_rx_crc_ignored_by_default(monkeypatch):
+    uart = _fake_uart(monkeypatch)
+    uart._ser.replies.append(_bad_crc(READ_RPY))
+    assert uart.read_fields(["VOUT_MEASURED"]) == {"VOUT_MEASURED": 10000}
+    assert uart.rx_crc_err_count == 0
+    uart.close()
+
+
+def test_rx_crc_checked_when_enabled(monkeypatch):
+    uart = _fake_uart(monkeypatch, check_crc=True)
+    uart._ser.replies.append(_bad_crc(READ_RPY))
+    assert uart.read_fields(["VOUT_MEASURED"]) == {}
+    assert uart.rx_crc_err_count == 1
+
+    uart._ser.replies.append(READ_RPY)
+    assert uart.read_fields(["VOUT_MEASURED"]) == {"VOUT_MEASURED": 10000}
+    uart.close()
+
+
+def test_oversize_read_rejected(monkeypatch):
+    uart = _fake_uart(monkeypatch)
+    fields = [fd.name for fd in mmpsu.MMPSU_V2_REGS]
+    # more fields than registers, so the reply couldn't fit in a packet
+    assert uart.read_fields(fields + fields[:1]) == {}
+    assert uart._ser.written == []
+    uart.close()
+
+
+def test_read_all_fields(monkeypatch):
+    uart = _fake_uart(monkeypatch)
+    regs = mmpsu.MMPSU_V2_REGS
+    payload = bytearray(5 * len(regs))
+    for i, fd in enumerate(regs):
+        fd.pack_into(payload, fd.field_type(1), 5 * i)
+    uart._ser.replies.append(_packet(mmpsu.MmpsuV2Commands.CMD_READ_ALL, payload))
+    assert uart.read_all_fields() == {fd.name: fd.field_type(1) for fd in regs}
+    uart.close()